@@ -0,0 +1,47 @@
+import os
+import random
+import shutil
+import sys
+import tempfile
+
+# Checks that resuming from a checkpoint continues the same game: plays STEPS
+# steps with `simulate.soak` in one go, then plays the same game again, stopping
+# at CHECKPOINT_STEP and resuming from its checkpoint, and fails if the two
+# runs end with different metrics.
+#
+#     python checkpoint_test.py
+
+STEPS = 3000
+CHECKPOINT_STEP = 2000
+GRAPH_SEED = 'I am a checkpoint test seed!'
+
+def run(steps, checkpoint_path=None):
+    import simulate
+    # Game graphs aren't seeded, so seed the generator they use instead
+    random.seed(GRAPH_SEED)
+    return simulate.soak(steps, checkpoint_path)[-1]
+
+def main():
+    import simulate
+    simulate.SOAK_REPORT_INTERVAL = CHECKPOINT_STEP
+    simulate.SOAK_CHECKPOINT_INTERVAL = CHECKPOINT_STEP
+
+    expected = run(STEPS)
+
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        checkpoint_path = os.path.join(tmp_dir, 'checkpoint')
+        run(CHECKPOINT_STEP, checkpoint_path)
+        resumed = run(STEPS, checkpoint_path)
+    finally:
+        shutil.rmtree(tmp_dir)
+
+    for key in ('steps', 'money', 'created', 'fulfilled'):
+        print '%-10s uninterrupted %10d  resumed %10d' % (key, expected[key], resumed[key])
+        if expected[key] != resumed[key]:
+            print 'FAIL: the resumed game played out differently'
+            exit(1)
+    print 'OK'
+
+if __name__ == "__main__":
+    main()
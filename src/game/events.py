@@ -0,0 +1,223 @@
+import json
+import logging as log
+import traceback
+from collections import defaultdict, namedtuple
+from settings import *
+
+# Event codes. Each event carries the time step it happened at and a tuple of
+# integer arguments; the meaning of the arguments is given by its template.
+COMMANDS_NOT_LIST     = 1
+BAD_COMMAND           = 2
+BUILD_DUPLICATE       = 3
+BUILD_NO_MONEY        = 4
+EDGE_IN_USE           = 5
+PATH_NOT_FROM_STATION = 6
+PATH_WRONG_END        = 7
+ORDER_UNSATISFIABLE   = 8
+ORDER_MISSING         = 9
+STEP_AFTER_OVER       = 10
+PLAYER_TIMEOUT        = 11
+PLAYER_ERROR          = 12
+ORDER_FULFILLED       = 13
+EVENTS_SUPPRESSED     = 14
+EVENTS_DROPPED        = 15
+ORDER_CREATED         = 16
+STEP_DONE             = 17
+PLAYER_SKIPPED        = 18
+
+# code -> (name, logging level, message template)
+EVENT_INFO = {
+    COMMANDS_NOT_LIST:     ('commands_not_list', log.WARNING,
+                            'Player.step must return a list of commands'),
+    BAD_COMMAND:           ('bad_command', log.WARNING,
+                            'Commands must be constructed with build_command and send_command'),
+    BUILD_DUPLICATE:       ('build_duplicate', log.WARNING,
+                            'Can\'t build on the same place you\'ve already built (node %d)'),
+    BUILD_NO_MONEY:        ('build_no_money', log.WARNING,
+                            'Don\'t have enough money to build a restaurant, need %d'),
+    EDGE_IN_USE:           ('edge_in_use', log.WARNING,
+                            'Cannot use edge (%d, %d) that is already in use'),
+    PATH_NOT_FROM_STATION: ('path_not_from_station', log.WARNING,
+                            'Path must start at a station (starts at %d)'),
+    PATH_WRONG_END:        ('path_wrong_end', log.WARNING,
+                            'Path must end at the order node (ends at %d, order at %d)'),
+    ORDER_UNSATISFIABLE:   ('order_unsatisfiable', log.WARNING,
+                            'Can\'t satisfy order %d with path of length %d'),
+    ORDER_MISSING:         ('order_missing', log.WARNING,
+                            'Attempted to start an order %d that doesn\'t exist'),
+    STEP_AFTER_OVER:       ('step_after_over', log.WARNING,
+                            'Attempted to step after game is over'),
+    PLAYER_TIMEOUT:        ('player_timeout', log.ERROR,
+                            'Player exceeded its time limit of %d ms'),
+    PLAYER_ERROR:          ('player_error', log.ERROR,
+                            'Player raised an exception'),
+    PLAYER_SKIPPED:        ('player_skipped', log.ERROR,
+                            'Player not called, %d earlier calls are still running'),
+    ORDER_FULFILLED:       ('order_fulfilled', log.INFO,
+                            'Fulfilled order %d for %d after %d steps'),
+    EVENTS_SUPPRESSED:     ('events_suppressed', log.WARNING,
+                            'Suppressed %d more %s events this step'),
+    EVENTS_DROPPED:        ('events_dropped', log.WARNING,
+                            'Event buffer overflowed, dropped %d events'),
+    ORDER_CREATED:         ('order_created', log.DEBUG,
+                            'Created order %d at node %d for %d'),
+    STEP_DONE:             ('step_done', log.DEBUG,
+                            'Finished step with money %d'),
+}
+
+Event = namedtuple('Event', ['time', 'code', 'args', 'exc_info'])
+
+def event_name(code):
+    return EVENT_INFO[code][0]
+
+def event_args(event):
+    """
+    The arguments of an event as they are shown, with event codes replaced by
+    event names.
+    """
+    if event.code == EVENTS_SUPPRESSED:
+        (count, code) = event.args
+        return (count, event_name(code))
+    return event.args
+
+def format_event(event):
+    (name, level, template) = EVENT_INFO[event.code]
+    message = template % event_args(event) if event.args else template
+    if event.exc_info is not None:
+        message += '\n' + ''.join(traceback.format_exception(*event.exc_info))
+    return message
+
+class ConsoleSink:
+    """
+    Writes events through the logging module. Messages are only formatted for
+    events whose level is enabled.
+    """
+
+    def handle(self, events):
+        logger = log.getLogger()
+        for event in events:
+            level = EVENT_INFO[event.code][1]
+            if logger.isEnabledFor(level):
+                logger.log(level, '[%s] %s' % (event_name(event.code), format_event(event)))
+
+class JsonlSink:
+    """
+    Writes one JSON object per event to a file (or file-like object).
+    """
+
+    def __init__(self, out):
+        if isinstance(out, basestring):
+            out = open(out, 'a')
+        self.out = out
+
+    def handle(self, events):
+        lines = []
+        for event in events:
+            obj = {
+                'time': event.time,
+                'event': event_name(event.code),
+                'args': list(event_args(event))
+            }
+            if event.exc_info is not None:
+                obj['exception'] = event.exc_info[0].__name__
+            lines.append(json.dumps(obj) + '\n')
+        self.out.writelines(lines)
+        self.out.flush()
+
+class CounterSink:
+    """
+    Keeps a running count of events seen, by event name.
+    """
+
+    def __init__(self):
+        self.counts = defaultdict(int)
+
+    def handle(self, events):
+        for event in events:
+            self.counts[event_name(event.code)] += 1
+
+class EventBus:
+    """
+    Collects game events into a bounded buffer and hands them to sinks once
+    per step. Emitting an event only stores a tuple of integers, so the cost
+    of formatting is paid by the sinks, and only for events which survive
+    rate limiting. Events at WARNING level or above are limited to rate_limit
+    per code per step. When the buffer fills up new events are dropped, and
+    part of it is kept for warnings so that lower level events can't crowd
+    them out. Suppressed and dropped events are summarized at each flush.
+    --- Fields ---
+    enabled : bool
+        False if events are being discarded.
+    sinks : sink list
+        Objects with a handle(events) method, called from flush().
+    buffer : Event list
+        Events emitted since the last flush.
+    dropped : int
+        Number of events lost since the last flush because the buffer was full.
+    """
+
+    def __init__(self, sinks=None, size=EVENT_BUFFER_SIZE,
+                 rate_limit=EVENT_RATE_LIMIT, enabled=EVENTS_ENABLED):
+        self.sinks = sinks if sinks is not None else []
+        self.buffer = []
+        self.size = size
+        self.rate_limit = rate_limit
+        self.time = 0
+        self.dropped = 0
+        self.counts = defaultdict(int)
+        self.limited = set(code for code, (name, level, template)
+                           in EVENT_INFO.iteritems() if level >= log.WARNING)
+        # Events below WARNING may only fill the buffer up to this size
+        self.unlimited_size = size - min(size // 2, rate_limit * len(self.limited))
+        self.set_enabled(enabled)
+
+    def set_enabled(self, enabled):
+        self.enabled = enabled
+        if not enabled:
+            self.emit = self._discard
+        elif 'emit' in self.__dict__:
+            del self.emit
+
+    def _discard(self, code, *args, **kwargs):
+        pass
+
+    def emit(self, code, *args, **kwargs):
+        if code in self.limited:
+            count = self.counts[code] + 1
+            self.counts[code] = count
+            if count > self.rate_limit:
+                return
+            size = self.size
+        else:
+            size = self.unlimited_size
+
+        if len(self.buffer) >= size:
+            self.dropped += 1
+            return
+        self.buffer.append(Event(self.time, code, args, kwargs.get('exc_info')))
+
+    def flush(self, time=None):
+        """
+        Hands buffered events to the sinks and resets the per-step rate limits.
+        Called by the game at the end of each step, with the next time step.
+        """
+        # The summaries are added after the buffered events rather than into
+        # the buffer, so they never displace anything
+        events = self.buffer
+        for code, count in self.counts.iteritems():
+            if count > self.rate_limit:
+                events.append(Event(self.time, EVENTS_SUPPRESSED,
+                                    (count - self.rate_limit, code), None))
+        self.counts.clear()
+
+        if self.dropped:
+            events.append(Event(self.time, EVENTS_DROPPED, (self.dropped,), None))
+            self.dropped = 0
+
+        self.buffer = []
+        if time is not None:
+            self.time = time
+
+        if events:
+            for sink in self.sinks:
+                sink.handle(events)
@@ -1,29 +1,46 @@
 import networkx as nx
 import random
-import json
-import multiprocessing
 import logging as log
 import functools
-import traceback
+import sys
 from importlib import import_module
 from copy import deepcopy
 from state import State
 from order import Order
 from threading import Thread
 from settings import *
-from graphs import generate_graph
+from graphs import generate_graph, sort_graph
+from scenario import random_order, to_csr
+from events import *
+
+class PlayerTimeout(Exception):
+    pass
+
+# Raised instead of calling the player when too many earlier calls are still
+# running (see MAX_HUNG_THREADS)
+class PlayerSkipped(PlayerTimeout):
+    def __init__(self, message, hung):
+        PlayerTimeout.__init__(self, message)
+        self.hung = hung
+
+# Threads of timed out calls which are still running. Python can't kill them,
+# so once there are MAX_HUNG_THREADS of these we stop starting new ones.
+hung_threads = []
 
 def timeout(timeout):
     def deco(func):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            res = [Exception('function [%s] timeout [%s seconds] exceeded!' % (func.__name__, timeout))]
+            hung_threads[:] = [t for t in hung_threads if t.is_alive()]
+            if len(hung_threads) >= MAX_HUNG_THREADS:
+                raise PlayerSkipped('function [%s] not called, %d earlier calls still running' % (func.__name__, len(hung_threads)), len(hung_threads))
+
+            res = [None, None] # [return value, exc_info if func raised]
             def newFunc():
                 try:
                     res[0] = func(*args, **kwargs)
-                except Exception as e:
-                    log.error(traceback.format_exc(e))
-                    res[0] = e
+                except Exception:
+                    res[1] = sys.exc_info()
             t = Thread(target=newFunc)
             t.daemon = True
             try:
@@ -32,44 +49,114 @@ def timeout(timeout):
             except Exception, je:
                 print 'error starting thread'
                 raise je
-            ret = res[0]
-            if isinstance(ret, BaseException):
-                raise ret
-            return ret
+            if t.is_alive():
+                hung_threads.append(t)
+                raise PlayerTimeout('function [%s] timeout [%s seconds] exceeded!' % (func.__name__, timeout))
+            if res[1] is not None:
+                raise res[1][0], res[1][1], res[1][2]
+            return res[0]
         return wrapper
     return deco
 
 class Game:
-    def __init__(self, player_module_path, seed):
+    def __init__(self, player_module_path, seed, events=None, state=None,
+                 scenario=None, player=None):
         log.basicConfig(level=LOG_LEVEL,
-                        format='%(levelname)7s:%(filename)s:%(lineno)03d :: %(message)s')
+                        format='%(levelname)7s :: %(message)s')
+
+        # Rejected commands, player errors, etc. are reported as events
+        self.events = events if events is not None else EventBus([ConsoleSink()])
 
         self.random = random.Random()
         self.random.seed(seed)
 
-        self.state = State(generate_graph())
-        G = self.state.get_graph()
-        for (u, v) in G.edges():
-            G.edge[u][v]['in_use'] = False # True if edge is used for any train
-
-        for n in G.nodes():
-            G.node[n]['is_station'] = False  # True if the node is a player's building
+        # If set, the graph, hubs and orders come from this Scenario.
+        # next_order is the index of the first of its orders not yet created.
+        self.scenario = scenario
+        self.next_order = 0
+        self.length = GAME_LENGTH if scenario is None else scenario.length
+
+        if state is not None:
+            # Resuming a game in progress, see from_checkpoint
+            self.state = state
+            G = sort_graph(self.state.get_graph())
+        else:
+            if scenario is not None:
+                self.state = State(scenario.build_graph())
+            else:
+                self.state = State(generate_graph())
+            # Unpickling the graph changes the order of its dicts, so put it in
+            # an order a resumed game can restore, to play out the same way
+            G = sort_graph(self.state.get_graph())
+            for (u, v) in G.edges():
+                G.edge[u][v]['in_use'] = False # True if edge is used for any train
+
+            for n in G.nodes():
+                G.node[n]['is_station'] = False  # True if the node is a player's building
+
+            # Precompute the adjacency arrays so copies of the state given to
+            # the player already have them. Graphs whose nodes aren't numbered
+            # 0..n-1 have no array views, so there is nothing to precompute.
+            try:
+                G.graph['csr'] = to_csr(G)
+            except ValueError:
+                pass
 
         def initialize_player(state):
             module = import_module(player_module_path)
             return module.Player(state)
 
-        func = timeout(timeout=INIT_TIMEOUT)(initialize_player)
-        try:
-            player = func(deepcopy(self.state))
-        except:
-            exit()
+        # A resumed game brings its own player
+        if player is None:
+            func = timeout(timeout=INIT_TIMEOUT)(initialize_player)
+            try:
+                player = func(deepcopy(self.state))
+            except PlayerSkipped as e:
+                self.events.emit(PLAYER_SKIPPED, e.hung)
+                self.events.flush()
+                exit()
+            except PlayerTimeout:
+                self.events.emit(PLAYER_TIMEOUT, int(INIT_TIMEOUT * 1000))
+                self.events.flush()
+                exit()
+            except Exception:
+                self.events.emit(PLAYER_ERROR, exc_info=sys.exc_info())
+                self.events.flush()
+                exit()
 
         self.player = player
 
-        hubs = deepcopy(G.nodes())
-        self.random.shuffle(hubs)
-        self.hubs = hubs[:HUBS]
+        if scenario is not None:
+            self.hubs = scenario.get_hubs()
+        else:
+            hubs = deepcopy(G.nodes())
+            self.random.shuffle(hubs)
+            self.hubs = hubs[:HUBS]
+
+    # Everything needed to resume the game later with from_checkpoint,
+    # including the player. Only what the player stores on itself is kept, so
+    # players that keep state in class attributes or module globals can't be
+    # resumed correctly.
+    def checkpoint(self):
+        return {
+            'state': self.state,
+            'player': self.player,
+            'random': self.random.getstate(),
+            'hubs': self.hubs,
+            'length': self.length,
+            'next_order': self.next_order
+        }
+
+    @classmethod
+    def from_checkpoint(cls, checkpoint, events=None, scenario=None):
+        game = cls(None, None, events=events, state=checkpoint['state'],
+                   scenario=scenario, player=checkpoint['player'])
+        game.random.setstate(checkpoint['random'])
+        game.hubs = checkpoint['hubs']
+        game.length = checkpoint['length']
+        game.next_order = checkpoint['next_order']
+        game.events.flush(game.state.get_time())
+        return game
 
     def to_dict(self):
         G = self.state.get_graph()
@@ -87,24 +174,25 @@ class Game:
     # True iff the game should end
     def is_over(self):
         # Arbitrary end condition for now, should think about this
-        return self.state.get_time() >= GAME_LENGTH
+        return self.state.get_time() >= self.length
 
     # Create a new order to put in pending_orders
     # Can return None instead if we don't want to make an order this time step
     def generate_order(self):
-        if (self.random.random() > ORDER_CHANCE):
+        if self.scenario is not None:
+            order = None
+            if self.next_order < self.scenario.num_orders:
+                (node, money, time) = self.scenario.get_order(self.next_order)
+                if time == self.state.get_time():
+                    order = (node, money)
+                    self.next_order += 1
+        else:
+            order = random_order(self.random, self.state.get_graph(), self.hubs)
+
+        if order is None:
             return None
 
-        graph = self.state.get_graph()
-        node = self.random.choice(self.hubs)
-
-        # Perform a random walk on a Gaussian distance from the hub
-        for i in range(int(abs(self.random.gauss(0, ORDER_VAR)))):
-            node = self.random.choice(graph.neighbors(node))
-
-        # Money for the order is from a Gaussian centered around 100
-        money = int(self.random.gauss(SCORE_MEAN, SCORE_VAR))
-
+        (node, money) = order
         return Order(self.state, node, money)
 
     # Get the cost for constructing a new building
@@ -123,15 +211,15 @@ class Game:
         G = self.state.get_graph()
         for (u, v) in self.path_to_edges(path):
             if G.edge[u][v]['in_use']:
-                log.warning('Cannot use edge (%d, %d) that is already in use (your path: %s)' % (u, v, path))
+                self.events.emit(EDGE_IN_USE, u, v)
                 return False
 
         if not G.node[path[0]]['is_station']:
-            log.warning('Path must start at a station')
+            self.events.emit(PATH_NOT_FROM_STATION, path[0])
             return False
 
         if path[-1] != order.get_node():
-            log.warning('Path must end at the order node')
+            self.events.emit(PATH_WRONG_END, path[-1], order.get_node())
             return False
 
         return True
@@ -139,14 +227,13 @@ class Game:
     # Attempt to execute each of the commands returned from the player
     def process_commands(self, commands):
         if not isinstance(commands, list):
-            log.warning('Player.step must return a list of commands')
+            self.events.emit(COMMANDS_NOT_LIST)
             return
 
-        GENERIC_COMMAND_ERROR = 'Commands must be constructed with build_command and send_command'
         G = self.state.get_graph()
         for command in commands:
             if not isinstance(command, dict) or 'type' not in command:
-                log.warning(GENERIC_COMMAND_ERROR)
+                self.events.emit(BAD_COMMAND)
                 continue
 
             command_type = command['type']
@@ -154,17 +241,17 @@ class Game:
             # Building a new location on the graph
             if command_type == 'build':
                 if not 'node' in command:
-                    log.warning(GENERIC_COMMAND_ERROR)
+                    self.events.emit(BAD_COMMAND)
                     continue
 
                 node = command['node']
                 if G.node[node]['is_station']:
-                    log.warning('Can\'t build on the same place you\'ve already built')
+                    self.events.emit(BUILD_DUPLICATE, node)
                     continue
 
                 cost = self.build_cost()
                 if self.state.get_money() < cost:
-                    log.warning('Don\'t have enough money to build a restaurant, need %s' % cost)
+                    self.events.emit(BUILD_NO_MONEY, int(cost))
                     continue
 
                 self.state.incr_money(-cost)
@@ -173,13 +260,17 @@ class Game:
             # Satisfying an order ("send"ing a train)
             elif command_type == 'send':
                 if 'order' not in command or 'path' not in command:
-                    log.warning(GENERIC_COMMAND_ERROR)
+                    self.events.emit(BAD_COMMAND)
                     continue
 
                 order = command['order']
                 path = command['path']
+                if not isinstance(order, Order) or not isinstance(path, list) or not path:
+                    self.events.emit(BAD_COMMAND)
+                    continue
+
                 if not self.can_satisfy_order(order, path):
-                    log.warning('Can\'t satisfy order %s with path %s' % (order, path))
+                    self.events.emit(ORDER_UNSATISFIABLE, order.id, len(path))
                     continue
 
                 pending_orders = self.state.get_pending_orders()
@@ -192,7 +283,7 @@ class Game:
                         break
 
                 if not found:
-                    log.warning("Attempted to start an order %s that doesn't exist" % order)
+                    self.events.emit(ORDER_MISSING, order.id)
                     continue
 
                 self.state.get_active_orders().append((order, path))
@@ -206,7 +297,8 @@ class Game:
     # Take the world through a time step
     def step(self):
         if self.is_over():
-            log.warning("Attempted to step after game is over")
+            self.events.emit(STEP_AFTER_OVER)
+            self.events.flush()
             return
 
         #log.info("~~~~~~~ TIME %04d ~~~~~~~" % self.state.get_time())
@@ -216,8 +308,12 @@ class Game:
         # First create a new order
         new_order = self.generate_order()
         if new_order is not None:
+            self.events.emit(ORDER_CREATED, new_order.id, new_order.get_node(),
+                             new_order.get_money())
             if G.node[new_order.get_node()]['is_station']:
                 self.state.incr_money(new_order.get_money())
+                self.events.emit(ORDER_FULFILLED, new_order.id,
+                                 new_order.get_money(), 0)
             else:
                 self.state.get_pending_orders().append(new_order)
 
@@ -230,7 +326,8 @@ class Game:
             self.state.get_active_orders().remove((order, path))
             money_gained = self.state.money_from(order)
             self.state.incr_money(money_gained)
-            log.info("Fulfilled order of %d" % money_gained)
+            self.events.emit(ORDER_FULFILLED, order.id, int(money_gained),
+                             self.state.get_time() - order.get_time_created())
 
             for (u, v) in self.path_to_edges(path):
                 G.edge[u][v]['in_use'] = False
@@ -244,10 +341,19 @@ class Game:
         state_copy = deepcopy(self.state)
         try:
             commands = func(state_copy)
-        except:
+        except PlayerSkipped as e:
+            self.events.emit(PLAYER_SKIPPED, e.hung)
+            commands = []
+        except PlayerTimeout:
+            self.events.emit(PLAYER_TIMEOUT, int(STEP_TIMEOUT * 1000))
+            commands = []
+        except Exception:
+            self.events.emit(PLAYER_ERROR, exc_info=sys.exc_info())
             commands = []
 
         self.process_commands(commands)
 
         # Go to the next time step
+        self.events.emit(STEP_DONE, int(self.state.get_money()))
         self.state.incr_time()
+        self.events.flush(self.state.get_time())
@@ -0,0 +1,92 @@
+from collections import deque
+from settings import *
+from events import ORDER_CREATED, ORDER_FULFILLED, STEP_DONE
+
+def percentile(sorted_values, p):
+    """
+    Nearest-rank percentile of an already sorted list, None if it is empty.
+    """
+    if not sorted_values:
+        return None
+    rank = int(round(p / 100.0 * (len(sorted_values) - 1)))
+    return sorted_values[rank]
+
+class StreamingMetrics:
+    """
+    An event sink which aggregates a game into a fixed amount of memory, for
+    runs too long to keep a full history of. Only the last `window` steps are
+    kept, as one summary per step.
+    --- Fields ---
+    steps : int
+        Total steps seen.
+    created : int
+        Total orders created.
+    fulfilled : int
+        Total orders fulfilled.
+    money : int
+        Money at the end of the last step seen.
+    """
+
+    def __init__(self, window=METRICS_WINDOW):
+        self.steps = 0
+        self.created = 0
+        self.fulfilled = 0
+        self.money = STARTING_MONEY
+
+        # Each entry is (time, money, orders created, orders fulfilled)
+        self.history = deque(maxlen=window)
+        # Each entry is (time, latency) for an order fulfilled in the window
+        self.latencies = deque()
+
+        self.step_created = 0
+        self.step_fulfilled = 0
+
+    def handle(self, events):
+        for event in events:
+            if event.code == ORDER_CREATED:
+                self.step_created += 1
+            elif event.code == ORDER_FULFILLED:
+                self.step_fulfilled += 1
+                self.latencies.append((event.time, event.args[2]))
+            elif event.code == STEP_DONE:
+                self.end_step(event.time, event.args[0])
+
+    def end_step(self, time, money):
+        self.steps += 1
+        self.created += self.step_created
+        self.fulfilled += self.step_fulfilled
+        self.money = money
+        self.history.append((time, money, self.step_created, self.step_fulfilled))
+        self.step_created = 0
+        self.step_fulfilled = 0
+
+        oldest = self.history[0][0]
+        while self.latencies and self.latencies[0][0] < oldest:
+            self.latencies.popleft()
+
+    def summary(self):
+        """
+        Returns a dict of cumulative and windowed metrics.
+        """
+        result = {
+            'steps': self.steps,
+            'money': self.money,
+            'created': self.created,
+            'fulfilled': self.fulfilled,
+            'fulfillment_ratio': float(self.fulfilled) / max(self.created, 1)
+        }
+
+        if self.history:
+            (first_time, first_money, _, _) = self.history[0]
+            (last_time, last_money, _, _) = self.history[-1]
+            created = sum(c for (_, _, c, _) in self.history)
+            fulfilled = sum(f for (_, _, _, f) in self.history)
+            result['window_money_rate'] = \
+                float(last_money - first_money) / max(last_time - first_time, 1)
+            result['window_fulfillment_ratio'] = float(fulfilled) / max(created, 1)
+
+        latencies = sorted(l for (_, l) in self.latencies)
+        for p in (50, 90, 99):
+            result['window_latency_p%d' % p] = percentile(latencies, p)
+
+        return result
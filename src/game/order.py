@@ -1,7 +1,5 @@
 import json
 
-order_id = 0
-
 class Order:
     """
     Describes a single order from a home. Tracks the following information:
@@ -18,13 +16,11 @@ class Order:
     """
 
     def __init__(self, state, node, money):
-        global order_id
         self.node = node
         self.money = money
         self.time_created = state.get_time()
         self.time_started = None
-        self.id = order_id
-        order_id += 1
+        self.id = state.new_order_id()
 
     def __repr__(self):
         return "(id %s, node %s, money %s)" % (str(self.id), str(self.node), str(self.money))
@@ -17,12 +17,6 @@ class Player(BasePlayer):
     name or the base class.
     """
 
-    # You can set up static state here
-    station_costs = dict()
-    stations = [] # list of graph nodes
-    neighbor_map = dict()
-    rank_map = defaultdict(int)
-
     def __init__(self, state):
         """
         Initializes your Player. You can set up persistent state, do analysis
@@ -32,14 +26,19 @@ class Player(BasePlayer):
         state : State
             The initial state of the game. See state.py for more information.
         """
+        # Keep all state on the instance (not the class or module) so it is
+        # saved along with the Player in game checkpoints
+        self.stations = [] # list of graph nodes
+        self.neighbor_map = dict()
+        self.rank_map = defaultdict(int)
+
         # Precompute cost of the i^th station as map
         self.station_costs = dict([
             (i, INIT_BUILD_COST * (BUILD_FACTOR ** i)) for i in xrange(state.graph.number_of_nodes())
         ])
 
         self.station_range = max(1, int(nx.radius(state.graph) * STATION_RANGE_MULTIPLIER))
-        global RANK_THRESHOLD
-        RANK_THRESHOLD = max(1, RANK_MULTIPLIER * int(nx.radius(state.graph)))
+        self.rank_threshold = max(1, RANK_MULTIPLIER * int(nx.radius(state.graph)))
 
         for node in state.graph.nodes():
             self.neighbor_map[node] = dict()
@@ -130,8 +129,8 @@ class Player(BasePlayer):
             while queue:
                 node, path = queue.popleft()
 
-                if update_rank and len(path) < RANK_THRESHOLD:
-                    self.rank_map[node] += RANK_THRESHOLD - len(path)
+                if update_rank and len(path) < self.rank_threshold:
+                    self.rank_map[node] += self.rank_threshold - len(path)
 
                 if node in self.stations:
                     curr_node = node
@@ -212,6 +211,7 @@ class Player(BasePlayer):
         if any([s in neighbors for s in self.stations]):
             return None
 
-        best_neighbor = max(neighbors, key=lambda v: self.rank_map[v])
+        # Sorted so that ties don't depend on the order of the set
+        best_neighbor = max(sorted(neighbors), key=lambda v: self.rank_map[v])
 
         return best_neighbor
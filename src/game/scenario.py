@@ -0,0 +1,179 @@
+"""
+A scenario is a graph, its hubs and every order of a game, fixed in advance
+and saved in a compact binary file. Games played from the same scenario see
+exactly the same graph and orders. The file is read through mmap, so loading
+it does no parsing and many processes reading one scenario share its pages.
+
+File layout (all integers are little-endian int32):
+    header   : magic 'AWAPSCN1', then length, nodes, adjacencies, hubs, orders
+    indptr   : nodes + 1 ints, neighbors of node u are indices[indptr[u]:indptr[u+1]]
+    indices  : adjacencies ints (each undirected edge appears twice)
+    hubs     : hubs ints
+    orders   : orders * (node, money, time) ints, sorted by time, at most one
+               order per time step
+"""
+
+import mmap
+import random
+import struct
+import sys
+import networkx as nx
+from array import array
+from settings import *
+from graphs import generate_graph
+
+MAGIC = 'AWAPSCN1'
+HEADER = struct.Struct('<8s5i')
+ORDER = struct.Struct('<3i')
+
+# Pick the node and money for a new order, or None if no order should be
+# created this step
+def random_order(rng, graph, hubs):
+    if (rng.random() > ORDER_CHANCE):
+        return None
+
+    node = rng.choice(hubs)
+
+    # Perform a random walk on a Gaussian distance from the hub. Neighbors are
+    # sorted so the walk doesn't depend on the order of the graph's adjacency
+    # dicts, which changes when the graph is copied or unpickled.
+    for i in range(int(abs(rng.gauss(0, ORDER_VAR)))):
+        node = rng.choice(sorted(graph.neighbors(node)))
+
+    # Money for the order is from a Gaussian centered around 100
+    money = int(rng.gauss(SCORE_MEAN, SCORE_VAR))
+
+    return (node, money)
+
+def to_csr(graph):
+    """
+    Converts a graph with nodes 0..n-1 into (indptr, indices) int arrays.
+    """
+    n = graph.number_of_nodes()
+    if sorted(graph.nodes()) != range(n):
+        raise ValueError("Graph nodes must be numbered 0 to %d" % (n - 1))
+
+    indptr = array('i', [0])
+    indices = array('i')
+    for u in xrange(n):
+        indices.extend(sorted(graph.neighbors(u)))
+        indptr.append(len(indices))
+    return (indptr, indices)
+
+def write_scenario(path, graph, hubs, orders, length=GAME_LENGTH):
+    """
+    Saves a scenario file.
+    --- Parameters ---
+    path : str
+        File to write.
+    graph : networkx.Graph
+        The graph, with nodes numbered 0..n-1.
+    hubs : int list
+        Nodes that orders are centered around.
+    orders : (node, money, time) list
+        Every order of the game, sorted by time, at most one per time step.
+    length : int
+        Number of steps in the game.
+    """
+    (indptr, indices) = to_csr(graph)
+    flat_orders = array('i')
+    last_time = -1
+    for (node, money, time) in orders:
+        if time <= last_time:
+            raise ValueError("Orders must be sorted by time, at most one per step")
+        last_time = time
+        flat_orders.extend((node, money, time))
+
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, length, len(indptr) - 1, len(indices),
+                            len(hubs), len(orders)))
+        for values in (indptr, indices, array('i', hubs), flat_orders):
+            if sys.byteorder == 'big':
+                values.byteswap()
+            values.tofile(f)
+
+def generate_scenario(path, seed, length=GAME_LENGTH):
+    """
+    Generates a graph, hubs and orders the same way Game does, from a seed,
+    and saves them to a scenario file.
+    """
+    rng = random.Random(seed)
+    graph = generate_graph(seed=rng.randint(0, 2**31 - 1))
+
+    hubs = graph.nodes()
+    rng.shuffle(hubs)
+    hubs = hubs[:HUBS]
+
+    orders = []
+    for time in xrange(length):
+        order = random_order(rng, graph, hubs)
+        if order is not None:
+            orders.append(order + (time,))
+
+    write_scenario(path, graph, hubs, orders, length)
+
+class Scenario:
+    """
+    A read-only view of a scenario file. Values are unpacked straight from
+    the mapped file as they are needed.
+    --- Fields ---
+    length : int
+        Number of steps in the game.
+    num_nodes : int
+        Number of nodes in the graph.
+    num_orders : int
+        Number of orders in the game.
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError("%s is not a scenario file" % path)
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self.mm) < HEADER.size:
+            self.close()
+            raise ValueError("%s is truncated or corrupt" % path)
+        (magic, self.length, self.num_nodes, num_adj, num_hubs, self.num_orders) = \
+            HEADER.unpack_from(self.mm, 0)
+
+        # Check the sizes now rather than failing partway through a game
+        counts = (self.num_nodes, num_adj, num_hubs, self.num_orders)
+        expected = HEADER.size + 4 * (self.num_nodes + 1 + num_adj + num_hubs) + \
+                   ORDER.size * self.num_orders
+        if min(counts) < 0 or len(self.mm) != expected:
+            self.close()
+            raise ValueError("%s is truncated or corrupt" % path)
+
+        self.indptr_offset = HEADER.size
+        self.indices_offset = self.indptr_offset + 4 * (self.num_nodes + 1)
+        self.hubs_offset = self.indices_offset + 4 * num_adj
+        self.orders_offset = self.hubs_offset + 4 * num_hubs
+        self.num_hubs = num_hubs
+
+    def close(self):
+        self.mm.close()
+
+    def ints(self, offset, count):
+        return list(struct.unpack_from('<%di' % count, self.mm, offset))
+
+    def get_hubs(self):
+        return self.ints(self.hubs_offset, self.num_hubs)
+
+    def build_graph(self):
+        """
+        Returns the scenario's graph as a new networkx.Graph.
+        """
+        graph = nx.Graph()
+        graph.add_nodes_from(xrange(self.num_nodes))
+        indptr = self.ints(self.indptr_offset, self.num_nodes + 1)
+        indices = self.ints(self.indices_offset, indptr[-1])
+        for u in xrange(self.num_nodes):
+            graph.add_edges_from((u, v) for v in indices[indptr[u]:indptr[u + 1]] if u < v)
+        return graph
+
+    def get_order(self, i):
+        """
+        Returns the i-th order as (node, money, time).
+        """
+        return ORDER.unpack_from(self.mm, self.orders_offset + ORDER.size * i)
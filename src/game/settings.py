@@ -5,6 +5,8 @@ LOG_LEVEL = log.WARNING   # change this to DEBUG, WARNING, ERROR to suppress
 
 INIT_TIMEOUT = 10.0     # Number of seconds your Player can take to load
 STEP_TIMEOUT = 0.5      # Number of seconds your Player.step can take
+MAX_HUNG_THREADS = 8    # Stop calling a Player with this many timed out calls
+                        # still running
 
 GAME_LENGTH = 1000      # Number of steps in a game
 STARTING_MONEY = 1000   # Starting money value
@@ -21,3 +23,13 @@ SCORE_VAR = 50.0        # Stddev for score distribution of an order
 # These two constants modify the grid_graph
 SPARSITY = 0.02        # Proportion of edges which will be removed
 DIAGONALS = 0.2        # Proportion of vertices with diagonals
+
+# Game event reporting (see events.py)
+EVENTS_ENABLED = True     # False to discard all events
+EVENT_BUFFER_SIZE = 1024  # Max events buffered between steps
+EVENT_RATE_LIMIT = 10     # Max warnings of each type reported per step
+
+# Long-horizon (soak) runs, see main.py
+METRICS_WINDOW = 1000              # Steps covered by the windowed metrics
+SOAK_REPORT_INTERVAL = 10000       # Steps between metrics reports
+SOAK_CHECKPOINT_INTERVAL = 100000  # Steps between checkpoints
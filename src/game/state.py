@@ -1,8 +1,26 @@
 from copy import deepcopy
+from collections import namedtuple
 from settings import *
+from scenario import to_csr
 import networkx as nx
 import json
 
+# numpy is only needed for the array views below
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+OrderArrays = namedtuple('OrderArrays', ['id', 'node', 'money', 'time_created'])
+
+def require_numpy():
+    if np is None:
+        raise ImportError("State's array views need numpy")
+
+def readonly(values):
+    values.flags.writeable = False
+    return values
+
 class State:
     """
     Describes the entire state of the game at a point in time. Tracks the
@@ -26,6 +44,18 @@ class State:
         A list of orders with a delivery in progress. Each element in the list
         is a tuple containing the order and a list of nodes corresponding to the
         path that order is taking.
+
+    The graph and orders can also be read as numpy arrays, which lets you
+    score every order at once instead of looping over them (these need numpy,
+    which is not available to competition submissions):
+        orders = state.get_pending_order_arrays()
+        value = orders.money - (state.get_time() - orders.time_created) * DECAY_FACTOR
+        best = orders.id[value.argsort()[::-1]]
+    The arrays are read-only and are built from the state when requested, so
+    they don't reflect changes you make to the graph afterwards. Arrays with an
+    entry per node are indexed by node, so they need the graph's nodes to be
+    numbered 0..n-1, as they are in generated and scenario graphs; otherwise
+    they raise ValueError.
     """
 
     def __init__(self, graph):
@@ -35,6 +65,7 @@ class State:
         self.pending_orders = []
         self.active_orders = []
         self.over = False
+        self.order_count = 0
 
     def get_graph(self): return self.graph
     def get_time(self): return self.time
@@ -42,6 +73,62 @@ class State:
     def get_pending_orders(self): return self.pending_orders
     def get_active_orders(self): return self.active_orders
 
+    def get_csr(self):
+        """
+        The graph as a compressed sparse row adjacency.
+        --- Returns ---
+        (indptr, indices) : (int array, int array)
+            The neighbors of node u are indices[indptr[u]:indptr[u + 1]], in
+            increasing order. Each edge appears once in each direction.
+        Raises ValueError if the nodes aren't numbered 0..n-1.
+        """
+        require_numpy()
+        if 'csr' not in self.graph.graph:
+            self.graph.graph['csr'] = to_csr(self.graph)
+        (indptr, indices) = self.graph.graph['csr']
+        return (readonly(np.frombuffer(indptr, dtype=np.intc)),
+                readonly(np.frombuffer(indices, dtype=np.intc)))
+
+    def get_edge_in_use(self):
+        """
+        A bool array aligned with the indices array of get_csr(), True where
+        the edge is used by an active order. Raises ValueError if the nodes
+        aren't numbered 0..n-1.
+        """
+        (indptr, indices) = self.get_csr()
+        in_use = np.zeros(len(indices), dtype=bool)
+        for (order, path) in self.active_orders:
+            for i in xrange(len(path) - 1):
+                for (u, v) in ((path[i], path[i + 1]), (path[i + 1], path[i])):
+                    start = indptr[u]
+                    in_use[start + np.searchsorted(indices[start:indptr[u + 1]], v)] = True
+        return readonly(in_use)
+
+    def get_station_mask(self):
+        """
+        A bool array with one entry per node, True where there is a station.
+        Raises ValueError if the nodes aren't numbered 0..n-1.
+        """
+        (indptr, indices) = self.get_csr()
+        n = len(indptr) - 1
+        mask = np.fromiter((self.graph.node[i]['is_station'] for i in xrange(n)),
+                           dtype=bool, count=n)
+        return readonly(mask)
+
+    def get_pending_order_arrays(self):
+        """
+        The pending orders as parallel arrays, in the same order as
+        get_pending_orders().
+        --- Returns ---
+        arrays : OrderArrays
+            Has int arrays id, node, money and time_created.
+        """
+        require_numpy()
+        columns = np.array([(o.id, o.node, o.money, o.time_created)
+                            for o in self.pending_orders], dtype=np.int64)
+        columns = columns.reshape((len(self.pending_orders), 4))
+        return OrderArrays(*[readonly(columns[:, i]) for i in xrange(4)])
+
     def to_dict(self):
         obj = deepcopy(self.__dict__)
         del obj['graph']
@@ -55,6 +142,11 @@ class State:
     def incr_time(self):
         self.time += 1
 
+    # Ids are unique within a game, so they restart at 0 for every new game
+    def new_order_id(self):
+        self.order_count += 1
+        return self.order_count - 1
+
     def money_from(self, order):
         total = order.get_money() - \
             (self.get_time() - order.get_time_created()) * \
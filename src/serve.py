@@ -0,0 +1,11 @@
+from simulate import make_game
+from server.server import run_server
+
+# Web server entry point. Kept apart from simulate.py so headless runs never
+# import Flask.
+
+def main():
+    run_server(make_game())
+
+if __name__ == "__main__":
+    main()
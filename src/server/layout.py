@@ -0,0 +1,152 @@
+import hashlib
+import math
+import random
+from collections import defaultdict, OrderedDict
+
+LAYOUT_ITERATIONS = 50  # Force simulation steps used to place nodes
+LAYOUT_SCALE = 10000    # Coordinates are sent as ints in [0, LAYOUT_SCALE]
+LAYOUT_CACHE_SIZE = 8   # Most layouts kept at once
+
+# fingerprint -> layout payload, so a graph is only laid out again once it
+# has fallen out of the cache. Ordered from least to most recently used.
+layout_cache = OrderedDict()
+
+def graph_fingerprint(graph):
+    """
+    A short hash of the graph's nodes and edges, the same for equal graphs.
+    """
+    h = hashlib.sha1()
+    h.update(','.join(str(n) for n in sorted(graph.nodes())))
+    h.update(';')
+    h.update(','.join('%s-%s' % e for e in sorted(tuple(sorted(e)) for e in graph.edges())))
+    return h.hexdigest()[:16]
+
+def force_layout(nodes, edges, seed, iterations=LAYOUT_ITERATIONS):
+    """
+    Fruchterman-Reingold layout in the unit square. Nodes are only repelled
+    by the centers of neighboring grid cells rather than by every other
+    node, so each iteration is linear in the size of the graph.
+    --- Parameters ---
+    nodes : int
+        Number of nodes, numbered 0..nodes-1.
+    edges : (int, int) list
+        Edges between node numbers.
+    --- Returns ---
+    (xs, ys) : (float list, float list)
+        Position of each node.
+    """
+    rng = random.Random(seed)
+    xs = [rng.random() for i in xrange(nodes)]
+    ys = [rng.random() for i in xrange(nodes)]
+    if nodes < 2:
+        return (xs, ys)
+
+    k = math.sqrt(1.0 / nodes)  # Ideal edge length
+    cell = 2 * k
+    temperature = 0.1
+
+    for it in xrange(iterations):
+        dxs = [0.0] * nodes
+        dys = [0.0] * nodes
+
+        # Total position and count of the nodes in each grid cell
+        grid = defaultdict(lambda: [0.0, 0.0, 0])
+        cells = []
+        for i in xrange(nodes):
+            key = (int(xs[i] / cell), int(ys[i] / cell))
+            totals = grid[key]
+            totals[0] += xs[i]
+            totals[1] += ys[i]
+            totals[2] += 1
+            cells.append(key)
+
+        # Repulsion from the center of each nearby cell, as strong as the
+        # number of nodes in it
+        for i in xrange(nodes):
+            x, y = xs[i], ys[i]
+            (cx, cy) = cells[i]
+            for gx in (cx - 1, cx, cx + 1):
+                for gy in (cy - 1, cy, cy + 1):
+                    totals = grid.get((gx, gy))
+                    if totals is None:
+                        continue
+                    (sx, sy, count) = totals
+                    if gx == cx and gy == cy:
+                        # Leave this node out of its own cell
+                        sx, sy, count = sx - x, sy - y, count - 1
+                    if count == 0:
+                        continue
+                    dx, dy = x - sx / count, y - sy / count
+                    dist2 = dx * dx + dy * dy
+                    if dist2 < 1e-12:
+                        dx, dy, dist2 = rng.random() * 1e-3, rng.random() * 1e-3, 1e-6
+                    force = count * k * k / dist2
+                    dxs[i] += dx * force
+                    dys[i] += dy * force
+
+        # Attraction along edges
+        for (u, v) in edges:
+            dx, dy = xs[u] - xs[v], ys[u] - ys[v]
+            dist = math.sqrt(dx * dx + dy * dy)
+            force = dist / k
+            dxs[u] -= dx * force
+            dys[u] -= dy * force
+            dxs[v] += dx * force
+            dys[v] += dy * force
+
+        # Move each node, at most temperature far
+        for i in xrange(nodes):
+            length = math.sqrt(dxs[i] ** 2 + dys[i] ** 2)
+            if length > 0:
+                step = min(length, temperature) / length
+                xs[i] = min(1.0, max(0.0, xs[i] + dxs[i] * step))
+                ys[i] = min(1.0, max(0.0, ys[i] + dys[i] * step))
+
+        temperature -= 0.1 / (iterations + 1)
+
+    return (xs, ys)
+
+def get_layout(graph):
+    """
+    Returns the layout of a graph as a compact payload, computing it the first
+    time it is asked for:
+        fingerprint : str
+        nodes : node list (xy and edges refer to positions in this list)
+        xy : flat [x0, y0, x1, y1, ...] ints in [0, LAYOUT_SCALE]
+        edges : flat [u0, v0, u1, v1, ...]
+    """
+    fingerprint = graph_fingerprint(graph)
+    if fingerprint in layout_cache:
+        payload = layout_cache.pop(fingerprint)
+        layout_cache[fingerprint] = payload
+        return payload
+
+    nodes = sorted(graph.nodes())
+    if not nodes:
+        return {'fingerprint': fingerprint, 'nodes': [], 'xy': [], 'edges': []}
+
+    index = dict((n, i) for (i, n) in enumerate(nodes))
+    edges = [(index[u], index[v]) for (u, v) in graph.edges()]
+    (xs, ys) = force_layout(len(nodes), edges, fingerprint)
+
+    # Stretch to fill the whole square
+    min_x, max_x = min(xs), max(xs)
+    min_y, max_y = min(ys), max(ys)
+    span_x = max(max_x - min_x, 1e-9)
+    span_y = max(max_y - min_y, 1e-9)
+
+    xy = []
+    for i in xrange(len(nodes)):
+        xy.append(int((xs[i] - min_x) / span_x * LAYOUT_SCALE))
+        xy.append(int((ys[i] - min_y) / span_y * LAYOUT_SCALE))
+
+    payload = {
+        'fingerprint': fingerprint,
+        'nodes': nodes,
+        'xy': xy,
+        'edges': [i for edge in edges for i in edge]
+    }
+    layout_cache[fingerprint] = payload
+    while len(layout_cache) > LAYOUT_CACHE_SIZE:
+        layout_cache.popitem(last=False)
+    return payload
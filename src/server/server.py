@@ -1,5 +1,7 @@
 from flask import Flask, render_template, request
+from layout import get_layout
 import json, csv, re, zlib, base64, requests
+import networkx as nx
 
 app = Flask(__name__)
 game = None
@@ -11,17 +13,28 @@ def home():
     team = request.args.get('team', '')
     rnd = request.args.get('round', '')
     log = json.dumps('')
+    layout = json.dumps('')
     if team != '':
         params = {'team': team, 'round': rnd}
         log = requests.get(LOG_SERVER + '/data', params=params).text
         compressed = re.findall(r'== START GAME OUTPUT --(.*)-- END GAME OUTPUT ==', log)
         if len(compressed) > 0:
             log = zlib.decompress(base64.b64decode(compressed[0]))
+            layout = json.dumps(log_layout(json.loads(log)))
         else:
             log = json.dumps({
                 'error': ''
             })
-    return render_template('index.html', log=log)
+    return render_template('index.html', log=log, layout=layout)
+
+# Layout for the graph of a recorded game, whose node ids were turned into
+# strings by JSON
+def log_layout(log):
+    graph = nx.Graph()
+    for (u, neighbors) in log['graph'].iteritems():
+        graph.add_node(int(u))
+        graph.add_edges_from((int(u), int(v)) for v in neighbors)
+    return get_layout(graph)
 
 @app.route('/tournament')
 def tournament():
@@ -36,6 +49,10 @@ def step():
 def graph():
     return json.dumps(game.get_graph())
 
+@app.route('/layout')
+def layout():
+    return json.dumps(get_layout(game.state.get_graph()))
+
 @app.route('/teams')
 def teams():
     try:
@@ -1,147 +1,357 @@
 $(function() {
-    function renderGraph(graph) {
-        var nodes = _.keys(graph).map(function(k) {
-            return {name: '', label: 'Test'};
-        });
+    var COLORS = {
+        link: '#666',
+        inUse: '#0f0',
+        train: 'rgb(255, 157, 0)',
+        node: '#000',
+        building: '#f00',
+        hasOrder: '#00f',
+        label: '#fff'
+    };
+
+    // Edge states
+    var EDGE_FREE = 0, EDGE_IN_USE = 1, EDGE_TRAIN = 2;
+    var EDGE_COLORS = [COLORS.link, COLORS.inUse, COLORS.train];
+
+    // Node state bits
+    var NODE_BUILDING = 1, NODE_ORDER = 2;
+
+    var NODE_COLORS = [COLORS.node, COLORS.building, COLORS.hasOrder];
+
+    var LINK_WIDTH = 3;       // pixels
+    var MIN_LABEL_RADIUS = 8; // pixels a node needs before it gets a label
+    var GRID = 64;            // cells per side of the index used for redraws
+    var MAX_PARTIAL_REDRAW = 500; // more changes than this redraw everything
+
+    // Draws a graph laid out by the server (see server/layout.py) onto a
+    // canvas. After the first frame only the areas around edges and nodes
+    // whose state changed are redrawn, except when the view is panned or
+    // zoomed.
+    function Renderer(layout) {
+        var n = layout.nodes.length;
+        var m = layout.edges.length / 2;
+
+        this.n = n;
+        this.ids = layout.nodes;
+        this.xs = new Float32Array(n);
+        this.ys = new Float32Array(n);
+        this.index = {}; // node id -> position in the layout
+        for (var i = 0; i < n; i++) {
+            this.xs[i] = layout.xy[2 * i];
+            this.ys[i] = layout.xy[2 * i + 1];
+            this.index[layout.nodes[i]] = i;
+        }
 
-        // Links = edges
-        var links = _(graph)
-            .mapValues(function(v, from) {
-                return _.keys(v).map(function(to) {
-                    return {source: parseInt(from), target: parseInt(to)};
-                });
-            })
-        .values()
-        .flatten()
-        .value();
-
-        // Uses http://marvl.infotech.monash.edu/webcola/ to simulate physics
-        var force = cola.d3adaptor()
-            .linkDistance(10)
-            .symmetricDiffLinkLengths(20)
-            .size([window.innerWidth, window.innerHeight])
-            .nodes(nodes)
-            .links(links);
-
-        // Iterate the force constraint
-        force.start();
-        for (var i = 0; i < 100; i++) { force.tick(); }
-        force.stop();
-
-        // Create d3 object and find the appropriate SVG elements
-        var svg = d3.select('body').append('svg')
-            .attr('width', window.innerWidth)
-            .attr('height', window.innerHeight);
-
-        svg.append("defs").selectAll("marker")
-            .data(["end"])
-            .enter().append("marker")
-            .attr("id", function(d) { return d; })
-            .attr("viewBox", "0 -5 10 10")
-            .attr("orient", "auto")
-            .append("path")
-            .attr("d", "M0,-5L10,0L0,5");
-
-        var group = svg.append('g');
-
-        var link = group
-            .selectAll('.link')
-            .data(links)
-            .enter()
-            .append('path')
-            .attr('class', 'link')
-
-            .attr('d', function(d) {
-                var dx = d.target.x - d.source.x,
-                    dy = d.target.y - d.source.y,
-                    dr = Math.sqrt(dx * dx + dy * dy);
-                return "M" + d.source.x + "," + d.source.y + "L" + d.target.x + "," + d.target.y;
-            })
-            .attr('marker-end', 'url(#end)');
-
-        var node = group
-            .selectAll('node')
-            .data(nodes)
-            .enter()
-            .append('g');
-
-        node.append('circle')
-            .attr('class', 'node')
-            .attr('r', 10);
-
-        node.append('text')
-            .attr('text-anchor', 'middle')
-            .attr('y', 5)
-            .text(function(d) { return d.index; });
-
-        // Update with values from the force constraint
-        link.attr("x1", function(d) { return d.source.x; })
-            .attr("y1", function(d) { return d.source.y; })
-            .attr("x2", function(d) { return d.target.x; })
-            .attr("y2", function(d) { return d.target.y; });
-
-        node.attr("transform", function(d) {
-            return "translate(" + d.x + ", " + d.y + ")";
-        });
+        this.edges = new Int32Array(layout.edges);
+        this.edgeIndex = {}; // edgeKey(u, v) -> edge number
+        for (var e = 0; e < m; e++) {
+            this.edgeIndex[this.edgeKey(this.edges[2 * e], this.edges[2 * e + 1])] = e;
+        }
 
-        svgPanZoom(svg[0][0])
-        return svg;
+        this.edgeState = new Uint8Array(m);
+        this.nodeState = new Uint8Array(n);
+        this.activeEdges = []; // edges not in EDGE_FREE
+        this.activeNodes = []; // nodes with some state bit set
+
+        // Leave each node a quarter of the average spacing between nodes
+        this.radius = 0.25 * 10000 / Math.sqrt(Math.max(n, 1));
+
+        this.allEdges = [];
+        for (e = 0; e < m; e++) this.allEdges.push(e);
+        this.allNodes = [];
+        for (i = 0; i < n; i++) this.allNodes.push(i);
+        this.buildIndex();
+
+        this.canvas = $('<canvas>').appendTo('body')[0];
+        this.ctx = this.canvas.getContext('2d');
+        this.resize();
+        this.fit();
+        this.bindControls();
+        this.drawAll();
     }
 
-    function updateGraph(svg, state) {
-        var link = svg.selectAll('.link');
-        var node = svg.selectAll('.node');
+    Renderer.prototype.edgeKey = function(u, v) {
+        return u < v ? u * this.n + v : v * this.n + u;
+    };
+
+    Renderer.prototype.resize = function() {
+        var ratio = window.devicePixelRatio || 1;
+        this.width = window.innerWidth;
+        this.height = window.innerHeight;
+        this.ratio = ratio;
+        this.canvas.width = this.width * ratio;
+        this.canvas.height = this.height * ratio;
+        this.canvas.style.width = this.width + 'px';
+        this.canvas.style.height = this.height + 'px';
+    };
+
+    // Show the whole graph
+    Renderer.prototype.fit = function() {
+        var margin = 20;
+        var size = 10000 + 2 * this.radius;
+        this.scale = Math.min(this.width - 2 * margin, this.height - 2 * margin) / size;
+        this.offsetX = (this.width - 10000 * this.scale) / 2;
+        this.offsetY = (this.height - 10000 * this.scale) / 2;
+    };
+
+    Renderer.prototype.bindControls = function() {
+        var self = this;
+        var dragging = null;
+
+        $(this.canvas).on('mousedown', function(ev) {
+            dragging = {x: ev.clientX, y: ev.clientY};
+        });
+
+        $(window).on('mousemove', function(ev) {
+            if (!dragging) return;
+            self.offsetX += ev.clientX - dragging.x;
+            self.offsetY += ev.clientY - dragging.y;
+            dragging = {x: ev.clientX, y: ev.clientY};
+            self.requestDraw();
+        }).on('mouseup', function() {
+            dragging = null;
+        }).on('resize', function() {
+            self.resize();
+            self.requestDraw();
+        });
+
+        // Zoom around the cursor
+        this.canvas.addEventListener('wheel', function(ev) {
+            ev.preventDefault();
+            var factor = ev.deltaY < 0 ? 1.1 : 1 / 1.1;
+            self.offsetX = ev.clientX - (ev.clientX - self.offsetX) * factor;
+            self.offsetY = ev.clientY - (ev.clientY - self.offsetY) * factor;
+            self.scale *= factor;
+            self.requestDraw();
+        });
+    };
+
+    Renderer.prototype.requestDraw = function() {
+        var self = this;
+        if (this.drawPending) return;
+        this.drawPending = true;
+        window.requestAnimationFrame(function() {
+            self.drawPending = false;
+            self.drawAll();
+        });
+    };
+
+    // Draw in layout coordinates from here on
+    Renderer.prototype.setTransform = function() {
+        var r = this.ratio;
+        this.ctx.setTransform(r * this.scale, 0, 0, r * this.scale,
+                              r * this.offsetX, r * this.offsetY);
+        this.ctx.lineWidth = LINK_WIDTH / this.scale;
+    };
+
+    // Node colors in the order they are drawn
+    Renderer.prototype.nodeColor = function(i) {
+        var s = this.nodeState[i];
+        // Orders take priority, matching the old SVG stylesheet
+        if (s & NODE_ORDER) return 2;
+        if (s & NODE_BUILDING) return 1;
+        return 0;
+    };
+
+    // Register every node and edge in the grid cells its bounding box covers
+    Renderer.prototype.buildIndex = function() {
+        this.cellSize = 10000 / GRID;
+        this.cellEdges = [];
+        this.cellNodes = [];
+        for (var c = 0; c < GRID * GRID; c++) {
+            this.cellEdges.push([]);
+            this.cellNodes.push([]);
+        }
 
-        node.attr('class', function(d) {
-            var c = 'node';
-            if (state.buildings.indexOf(d.index) > -1) {
-                c += ' building';
+        var self = this;
+        var r = this.radius;
+        for (var i = 0; i < this.n; i++) {
+            this.forCells(this.nodeBox(i, r), function(c) { self.cellNodes[c].push(i); });
+        }
+        for (var e = 0; e < this.edgeState.length; e++) {
+            this.forCells(this.edgeBox(e, 0), function(c) { self.cellEdges[c].push(e); });
+        }
+    };
+
+    // Bounding boxes as [x0, y0, x1, y1] in layout coordinates, grown by pad
+    Renderer.prototype.nodeBox = function(i, pad) {
+        return [this.xs[i] - pad, this.ys[i] - pad, this.xs[i] + pad, this.ys[i] + pad];
+    };
+
+    Renderer.prototype.edgeBox = function(e, pad) {
+        var u = this.edges[2 * e], v = this.edges[2 * e + 1];
+        return [Math.min(this.xs[u], this.xs[v]) - pad, Math.min(this.ys[u], this.ys[v]) - pad,
+                Math.max(this.xs[u], this.xs[v]) + pad, Math.max(this.ys[u], this.ys[v]) + pad];
+    };
+
+    Renderer.prototype.forCells = function(box, f) {
+        var size = this.cellSize;
+        function cell(v) { return Math.min(GRID - 1, Math.max(0, Math.floor(v / size))); }
+        for (var cx = cell(box[0]); cx <= cell(box[2]); cx++) {
+            for (var cy = cell(box[1]); cy <= cell(box[3]); cy++) {
+                f(cx * GRID + cy);
             }
+        }
+    };
+
+    Renderer.prototype.drawAll = function() {
+        var ctx = this.ctx;
+        ctx.setTransform(1, 0, 0, 1, 0, 0);
+        ctx.clearRect(0, 0, this.canvas.width, this.canvas.height);
+        this.setTransform();
+        this.drawItems(this.allEdges, this.allNodes);
+    };
+
+    // Draw the given edges and nodes (each in increasing order) the same way
+    // drawAll does, so redrawing part of the canvas matches a full redraw
+    Renderer.prototype.drawItems = function(edges, nodes) {
+        var ctx = this.ctx;
+
+        // One path per edge color
+        for (var s = EDGE_FREE; s <= EDGE_TRAIN; s++) {
+            ctx.beginPath();
+            edges.forEach(function(e) {
+                if (this.edgeState[e] == s) this.traceEdge(e);
+            }, this);
+            ctx.strokeStyle = EDGE_COLORS[s];
+            ctx.stroke();
+        }
 
-            state.pending_orders.forEach(function(order) {
-                if (order.node == d.index) {
-                    c += ' has-order';
-                }
-            });
+        // One path per node color
+        for (var c = 0; c < NODE_COLORS.length; c++) {
+            ctx.beginPath();
+            nodes.forEach(function(i) {
+                if (this.nodeColor(i) != c) return;
+                ctx.moveTo(this.xs[i] + this.radius, this.ys[i]);
+                ctx.arc(this.xs[i], this.ys[i], this.radius, 0, 2 * Math.PI);
+            }, this);
+            ctx.fillStyle = NODE_COLORS[c];
+            ctx.fill();
+        }
 
-            state.active_orders.forEach(function(order) {
-                if (order[0].node == d.index) {
-                    c += ' has-order';
-                }
+        nodes.forEach(this.drawLabel, this);
+    };
+
+    // Clear the given boxes and draw everything that overlaps them again
+    Renderer.prototype.redrawBoxes = function(boxes) {
+        var ctx = this.ctx;
+        var self = this;
+        var edges = {}, nodes = {};
+        // Anything reaching into a box: edge width, label overhang, rounding
+        var reach = LINK_WIDTH / this.scale + this.radius / 2 + 1 / this.scale;
+
+        ctx.save();
+        ctx.setTransform(1, 0, 0, 1, 0, 0);
+        ctx.beginPath();
+        boxes.forEach(function(box) {
+            // Whole device pixels, so nothing is left half cleared
+            var r = self.ratio;
+            var x0 = Math.floor(r * (self.scale * box[0] + self.offsetX));
+            var y0 = Math.floor(r * (self.scale * box[1] + self.offsetY));
+            var x1 = Math.ceil(r * (self.scale * box[2] + self.offsetX));
+            var y1 = Math.ceil(r * (self.scale * box[3] + self.offsetY));
+            ctx.rect(x0, y0, x1 - x0, y1 - y0);
+
+            var grown = [box[0] - reach, box[1] - reach, box[2] + reach, box[3] + reach];
+            self.forCells(grown, function(c) {
+                self.cellEdges[c].forEach(function(e) { edges[e] = true; });
+                self.cellNodes[c].forEach(function(i) { nodes[i] = true; });
             });
-
-            return c;
         });
+        ctx.clip();
+        ctx.clearRect(0, 0, this.canvas.width, this.canvas.height);
+
+        this.setTransform();
+        this.drawItems(sortedKeys(edges), sortedKeys(nodes));
+        ctx.restore();
+    };
+
+    Renderer.prototype.traceEdge = function(e) {
+        var u = this.edges[2 * e], v = this.edges[2 * e + 1];
+        this.ctx.moveTo(this.xs[u], this.ys[u]);
+        this.ctx.lineTo(this.xs[v], this.ys[v]);
+    };
+
+    Renderer.prototype.drawLabel = function(i) {
+        if (this.radius * this.scale < MIN_LABEL_RADIUS) return;
+        var ctx = this.ctx;
+        ctx.fillStyle = COLORS.label;
+        ctx.font = this.radius + 'px sans-serif';
+        ctx.textAlign = 'center';
+        ctx.textBaseline = 'middle';
+        ctx.fillText(this.ids[i], this.xs[i], this.ys[i]);
+    };
+
+    function sortedKeys(set) {
+        return Object.keys(set).map(Number).sort(function(a, b) { return a - b; });
+    }
 
-        link.attr('class', function(d) {
-            var c = 'link';
-
-            state.active_orders.forEach(function(data) {
-                var order = data[0];
-                var path = data[1];
-
-                for (var i = 0; i < path.length - 1; ++i) {
-                    if ((d.target.index == path[i] &&
-                         d.source.index == path[i + 1]) ||
-                        (d.source.index == path[i] &&
-                         d.target.index == path[i + 1])) {
-                        c += ' in-use';
+    // Apply a game state, redrawing only what changed since the last one
+    Renderer.prototype.update = function(state) {
+        var self = this;
+        var edges = {}, nodes = {};
 
-                        if (state.time - order.time_started == i + 1) {
-                            c += ' is-train';
-                        }
+        state.buildings.forEach(function(node) {
+            var i = self.index[node];
+            nodes[i] = (nodes[i] || 0) | NODE_BUILDING;
+        });
 
-                        break;
-                    }
-                }
-            });
+        state.pending_orders.forEach(function(order) {
+            var i = self.index[order.node];
+            nodes[i] = (nodes[i] || 0) | NODE_ORDER;
+        });
 
-            return c;
+        state.active_orders.forEach(function(data) {
+            var order = data[0];
+            var path = data[1];
+            var i = self.index[order.node];
+            nodes[i] = (nodes[i] || 0) | NODE_ORDER;
+
+            for (var j = 0; j < path.length - 1; ++j) {
+                var e = self.edgeIndex[self.edgeKey(self.index[path[j]], self.index[path[j + 1]])];
+                if (e === undefined) continue;
+                var s = state.time - order.time_started == j + 1 ? EDGE_TRAIN : EDGE_IN_USE;
+                edges[e] = Math.max(edges[e] || EDGE_FREE, s);
+            }
         });
 
+        var changedEdges = this.applyChanges(this.edgeState, this.activeEdges, edges);
+        var changedNodes = this.applyChanges(this.nodeState, this.activeNodes, nodes);
+        this.activeEdges = Object.keys(edges).map(Number);
+        this.activeNodes = Object.keys(nodes).map(Number);
+
+        if (changedEdges.length + changedNodes.length > MAX_PARTIAL_REDRAW) {
+            this.drawAll();
+        } else if (changedEdges.length + changedNodes.length > 0) {
+            var lineWidth = LINK_WIDTH / this.scale;
+            var boxes = changedEdges.map(function(e) { return self.edgeBox(e, lineWidth); });
+            changedNodes.forEach(function(i) { boxes.push(self.nodeBox(i, 1.5 * self.radius)); });
+            this.redrawBoxes(boxes);
+        }
+
         $('#time').text('Time: ' + state.time);
         $('#money').text('Money: ' + state.money);
-    }
+    };
+
+    // Sets states[i] = updates[i] (or 0 for previously active i not in
+    // updates) and returns the indices whose state changed
+    Renderer.prototype.applyChanges = function(states, active, updates) {
+        var changed = [];
+        active.forEach(function(i) {
+            if (!(i in updates)) {
+                states[i] = 0;
+                changed.push(i);
+            }
+        });
+        Object.keys(updates).forEach(function(key) {
+            var i = Number(key);
+            if (states[i] != updates[key]) {
+                states[i] = updates[key];
+                changed.push(i);
+            }
+        });
+        return changed;
+    };
 
     var playing = false;
     var interval;
@@ -190,7 +400,7 @@ $(function() {
                 $('body').append('<div class="error">This team has not completed this round or did not run correctly.</div>');
                 return;
             }
-            var svg = renderGraph(LOG.graph);
+            var renderer = new Renderer(LAYOUT);
             var curStep = 0;
 
             function step() {
@@ -199,19 +409,19 @@ $(function() {
                     togglePlay(step);
                 }
 
-                updateGraph(svg, LOG.orders[curStep]);
+                renderer.update(LOG.orders[curStep]);
                 curStep++;
             }
 
             playGame(step);
         } else {
             console.log('No log detected, querying server...');
-            $get('/graph').done(function(resp) {
-                var svg = renderGraph(JSON.parse(resp));
+            $get('/layout').done(function(resp) {
+                var renderer = new Renderer(JSON.parse(resp));
 
                 function step() {
                     $get('/step').done(function(resp) {
-                        updateGraph(svg, JSON.parse(resp));
+                        renderer.update(JSON.parse(resp));
                     });
                 }
 
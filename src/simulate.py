@@ -0,0 +1,211 @@
+from game.game import Game
+from game.events import EventBus, ConsoleSink
+from game.metrics import StreamingMetrics
+from game.scenario import Scenario, generate_scenario
+from game.settings import *
+import sys, json, os, time, subprocess, traceback, cPickle as pickle
+
+# Headless entry point: everything except the web server (see serve.py), so
+# it never pays for importing Flask.
+
+PLAYER = "game.player"
+
+def print_usage():
+    print 'Usage: %s [shell [scenario_file]|web|soak [steps] [checkpoint_file]|' \
+          'scenario scenario_file [seed]|batch games [workers] [steps]|' \
+          'bench-startup [games] [steps]]' % sys.argv[0]
+    exit(1)
+
+def make_game(events=None, scenario=None, player=PLAYER):
+    return Game(player, 'I am a random seed!', events=events, scenario=scenario)
+
+# Resident memory of this process in KB
+def current_rss():
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / 1024
+    except (IOError, OSError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+def report(metrics):
+    summary = metrics.summary()
+    summary['rss_kb'] = current_rss()
+    print json.dumps(summary, sort_keys=True)
+    sys.stdout.flush()
+    return summary
+
+def save_checkpoint(path, game, metrics):
+    # Write to a temporary file first so a crash never leaves a partial checkpoint
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'game': game.checkpoint(), 'metrics': metrics}, f,
+                        pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError) as e:
+        os.remove(tmp_path)
+        raise ValueError("Can't checkpoint the game, the Player can't be pickled: %s" % e)
+    os.rename(tmp_path, path)
+
+# The metrics are fed by events, so the bus is always enabled for soak runs.
+# EVENTS_ENABLED = False only turns off the console output.
+def soak_events(metrics):
+    sinks = [ConsoleSink(), metrics] if EVENTS_ENABLED else [metrics]
+    return EventBus(sinks, enabled=True)
+
+# Run a single game for `steps` steps keeping only aggregated metrics, which
+# are printed every SOAK_REPORT_INTERVAL steps. If checkpoint_path is given the
+# game is saved there every SOAK_CHECKPOINT_INTERVAL steps, and resumed from it
+# if it already exists. Returns the list of reports printed.
+def soak(steps, checkpoint_path=None, player=PLAYER):
+    if checkpoint_path is not None and os.path.exists(checkpoint_path):
+        with open(checkpoint_path, 'rb') as f:
+            saved = pickle.load(f)
+        metrics = saved['metrics']
+        game = Game.from_checkpoint(saved['game'], events=soak_events(metrics))
+        print 'Resumed from %s at step %d' % (checkpoint_path, game.state.get_time())
+    else:
+        metrics = StreamingMetrics()
+        game = make_game(events=soak_events(metrics), player=player)
+
+    reports = []
+    game.length = steps
+    while not game.is_over():
+        game.step()
+        time = game.state.get_time()
+        if time % SOAK_REPORT_INTERVAL == 0:
+            reports.append(report(metrics))
+        if checkpoint_path is not None and time % SOAK_CHECKPOINT_INTERVAL == 0:
+            save_checkpoint(checkpoint_path, game, metrics)
+
+    if game.state.get_time() % SOAK_REPORT_INTERVAL != 0:
+        reports.append(report(metrics))
+    return reports
+
+# Play the game to the end in a forked child, so the parent's copy is left
+# untouched for the next game. Returns (pid, fd to read the final money from).
+def fork_game(game, seed):
+    (read_fd, write_fd) = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        try:
+            game.random.seed(seed)
+            while not game.is_over():
+                game.step()
+            os.write(write_fd, '%d' % game.state.get_money())
+        except BaseException:
+            traceback.print_exc()
+            sys.stderr.flush()
+            os._exit(1)
+        os._exit(0)
+
+    os.close(write_fd)
+    return (pid, read_fd)
+
+# Play many games, importing and initializing (graph generation, Player
+# initialization) only once. Each game is played in a child forked from the
+# initialized game, with its own seed for orders, at most `workers` at a time.
+def batch(games, workers=1, steps=GAME_LENGTH):
+    game = make_game()
+    game.length = steps
+
+    results = {}
+    statuses = {}  # game number -> status from os.wait
+    running = {}  # pid -> (game number, fd)
+    next_game = 0
+    while next_game < games or running:
+        if next_game < games and len(running) < workers:
+            (pid, fd) = fork_game(game, 'I am game %d!' % next_game)
+            running[pid] = (next_game, fd)
+            next_game += 1
+            continue
+
+        (pid, status) = os.wait()
+        (number, fd) = running.pop(pid)
+        with os.fdopen(fd) as f:
+            output = f.read()
+        results[number] = int(output) if status == 0 and output else None
+        statuses[number] = status
+
+    for number in xrange(games):
+        status = statuses[number]
+        if os.WIFSIGNALED(status):
+            print 'Game %d: failed (killed by signal %d)' % (number, os.WTERMSIG(status))
+        elif status != 0:
+            print 'Game %d: failed (exit status %d)' % (number, os.WEXITSTATUS(status))
+        elif results[number] is None:
+            print 'Game %d: failed' % number
+        else:
+            print 'Game %d: $%d' % (number, results[number])
+    return results
+
+def time_command(args):
+    start = time.time()
+    with open(os.devnull, 'w') as devnull:
+        subprocess.check_call([sys.executable] + args, stdout=devnull,
+                              cwd=os.path.dirname(os.path.abspath(__file__)))
+    return time.time() - start
+
+# Compare startup costs: importing each entry point, and playing short games in
+# a fresh interpreter each versus forked from one initialized game.
+def bench_startup(games=20, steps=10):
+    base = time_command(['-c', 'pass'])
+    print 'Interpreter startup:  %6.0f ms' % (base * 1000)
+    for module in ('simulate', 'serve'):
+        elapsed = time_command(['-c', 'import %s' % module]) - base
+        print 'import %-13s %6.0f ms' % (module + ':', elapsed * 1000)
+
+    fresh = sum(time_command(['simulate.py', 'batch', '1', '1', str(steps)])
+                for i in xrange(games))
+    print '%d games of %d steps, one process each: %6.2f s' % (games, steps, fresh)
+
+    with open(os.devnull, 'w') as devnull:
+        stdout = sys.stdout
+        sys.stdout = devnull
+        start = time.time()
+        try:
+            batch(games, 1, steps)
+        finally:
+            sys.stdout = stdout
+    forked = time.time() - start
+    print '%d games of %d steps, forked:           %6.2f s' % (games, steps, forked)
+
+def main():
+    if len(sys.argv) == 1: print_usage()
+
+    command = sys.argv[1]
+    if command == 'web':
+        from serve import main as serve
+        serve()
+    elif command == 'shell':
+        scenario = Scenario(sys.argv[2]) if len(sys.argv) > 2 else None
+        game = make_game(scenario=scenario)
+        while not game.is_over():
+            game.step()
+
+        print 'Final money: $%d' % game.state.get_money()
+    elif command == 'soak':
+        steps = int(sys.argv[2]) if len(sys.argv) > 2 else 1000000
+        checkpoint_path = sys.argv[3] if len(sys.argv) > 3 else None
+        soak(steps, checkpoint_path)
+    elif command == 'scenario':
+        if len(sys.argv) < 3: print_usage()
+        seed = sys.argv[3] if len(sys.argv) > 3 else 'I am a random seed!'
+        generate_scenario(sys.argv[2], seed)
+    elif command == 'batch':
+        if len(sys.argv) < 3: print_usage()
+        workers = int(sys.argv[3]) if len(sys.argv) > 3 else 1
+        steps = int(sys.argv[4]) if len(sys.argv) > 4 else GAME_LENGTH
+        results = batch(int(sys.argv[2]), workers, steps)
+        if None in results.values():
+            exit(1)
+    elif command == 'bench-startup':
+        games = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+        steps = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+        bench_startup(games, steps)
+    else: print_usage()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import sys
+import networkx as nx
+from game.base_player import BasePlayer
+
+# Checks that a long-horizon run stays in constant memory: plays one game for
+# STEPS steps with `simulate.soak` and fails if the resident memory at the last
+# metrics report is more than MAX_RSS_GROWTH KB above the first one.
+#
+#     python soak_test.py [steps]
+
+STEPS = 1000000
+MAX_RSS_GROWTH = 10 * 1024  # KB
+GRAPH_SIZE = 30             # Smaller than a real game to keep the test fast;
+                            # copying the state for the player dominates a step
+
+class Player(BasePlayer):
+    """
+    A cheap player so the test time goes into the game engine: builds a single
+    station, then sends every order it can reach along a free shortest path.
+    """
+
+    def __init__(self, state):
+        self.station = None
+
+    def step(self, state):
+        graph = state.get_graph()
+        commands = []
+        orders = state.get_pending_orders()
+
+        if self.station is None:
+            if orders and state.get_money() >= 1000:
+                self.station = orders[0].get_node()
+                commands.append(self.build_command(self.station))
+            return commands
+
+        used = set()
+        for order in orders:
+            path = nx.shortest_path(graph, self.station, order.get_node())
+            edges = [tuple(sorted(e)) for e in zip(path, path[1:])]
+            if any(graph.edge[u][v]['in_use'] or (u, v) in used for (u, v) in edges):
+                continue
+            used.update(edges)
+            commands.append(self.send_command(order, path))
+        return commands
+
+def main():
+    import simulate
+    import game.graphs
+    game.graphs.GRAPH_SIZE = GRAPH_SIZE
+
+    steps = int(sys.argv[1]) if len(sys.argv) > 1 else STEPS
+    reports = simulate.soak(steps, player='soak_test')
+
+    growth = reports[-1]['rss_kb'] - reports[0]['rss_kb']
+    print 'RSS grew by %d KB over %d steps (limit %d KB)' % (growth, steps, MAX_RSS_GROWTH)
+    if growth >= MAX_RSS_GROWTH:
+        print 'FAIL: memory is not bounded'
+        exit(1)
+    print 'OK'
+
+if __name__ == "__main__":
+    main()